@@ -1,13 +1,31 @@
 """SPARQL/FastAPI utils."""
 
 from collections.abc import Iterator, Mapping
-from typing import cast
+from functools import lru_cache
+from typing import Any, cast
 
 from SPARQLWrapper import QueryResult
 from pydantic import BaseModel
 from rdfproxy.utils._types import _TModelInstance
 from toolz import valmap
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _load_query_result_json(query_result: QueryResult) -> Mapping:
+    """Parse the JSON response of a SPARQLWrapper.QueryResult.
+
+    If the optional orjson package is installed, the raw response body is parsed with orjson,
+    else parsing is delegated to QueryResult.convert.
+    """
+    if orjson is None:
+        return cast(Mapping, query_result.convert())
+
+    return orjson.loads(query_result.response.read())
+
 
 def get_bindings_from_query_result(query_result: QueryResult) -> Iterator[dict]:
     """Extract just the bindings from a SPARQLWrapper.QueryResult."""
@@ -17,7 +35,7 @@ def get_bindings_from_query_result(query_result: QueryResult) -> Iterator[dict]:
             f"Received object with requestedFormat '{result_format}'."
         )
 
-    query_json = cast(Mapping, query_result.convert())
+    query_json = _load_query_result_json(query_result)
     bindings = map(
         lambda binding: valmap(lambda v: v["value"], binding),
         query_json["results"]["bindings"],
@@ -26,6 +44,42 @@ def get_bindings_from_query_result(query_result: QueryResult) -> Iterator[dict]:
     return bindings
 
 
+def _compute_model_field_layout(
+    model: type[BaseModel],
+) -> tuple[tuple[str, type[BaseModel] | None, Any], ...]:
+    """Compute the field layout of a model class.
+
+    Every entry holds a field name, the field's model class (or None if the field is not a model)
+    and the field default.
+    """
+    return tuple(
+        (
+            name,
+            field.annotation if isinstance(field.annotation, type(BaseModel)) else None,
+            field.default,
+        )
+        for name, field in model.model_fields.items()
+    )
+
+
+_cached_model_field_layout = lru_cache(_compute_model_field_layout)
+
+
+def _get_model_field_layout(
+    model: type[BaseModel],
+) -> tuple[tuple[str, type[BaseModel] | None, Any], ...]:
+    """Get the field layout of a model class.
+
+    Layouts of complete models are cached, so model.model_fields is inspected once per model
+    instead of for every result row. Incomplete models (e.g. with unresolved forward references)
+    are not cached, since their model_fields change on model_rebuild.
+    """
+    if model.__pydantic_complete__:
+        return _cached_model_field_layout(model)
+
+    return _compute_model_field_layout(model)
+
+
 def instantiate_model_from_kwargs(
     model: type[_TModelInstance], **kwargs
 ) -> _TModelInstance:
@@ -52,22 +106,22 @@ def instantiate_model_from_kwargs(
     print(model)  # p='p value' q=NestedModel(a='a value', b=SimpleModel(x=1, y=2))
     """
 
-    def _get_bindings(model: type[_TModelInstance], **kwargs) -> dict:
+    def _get_bindings(model: type[_TModelInstance], kwargs: dict) -> dict:
         """Get the bindings needed for model instantation.
 
-        The function traverses model.model_fields
+        The function traverses the (cached) field layout of a model
         and constructs a bindings dict by either getting values from kwargs or field defaults.
         For model fields the recursive clause runs.
 
         Note: This needs exception handling and proper testing.
         """
         return {
-            k: (
-                v.annotation(**_get_bindings(v.annotation, **kwargs))
-                if isinstance(v.annotation, type(BaseModel))
-                else kwargs.get(k, v.default)
+            name: (
+                nested_model(**_get_bindings(nested_model, kwargs))
+                if nested_model is not None
+                else kwargs.get(name, default)
             )
-            for k, v in model.model_fields.items()
+            for name, nested_model, default in _get_model_field_layout(model)
         }
 
-    return model(**_get_bindings(model, **kwargs))
+    return model(**_get_bindings(model, kwargs))
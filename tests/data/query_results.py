@@ -0,0 +1,36 @@
+"""Offline SPARQLWrapper.QueryResult stubs for testing."""
+
+import io
+import json
+
+from SPARQLWrapper import QueryResult
+
+
+XSD = "http://www.w3.org/2001/XMLSchema#"
+
+
+class _Response(io.BytesIO):
+    """Minimal stand-in for the urllib response wrapped by QueryResult."""
+
+    def info(self) -> dict:
+        return {"content-type": "application/sparql-results+json"}
+
+
+def query_result_from_bindings(bindings: list[dict]) -> QueryResult:
+    """Construct a JSON QueryResult for a list of SPARQL JSON bindings."""
+    variables = sorted({var for binding in bindings for var in binding})
+    body = json.dumps(
+        {"head": {"vars": variables}, "results": {"bindings": bindings}}
+    ).encode("utf-8")
+
+    return QueryResult((_Response(body), "json"))
+
+
+typed_bindings = [
+    {
+        "x": {"type": "literal", "datatype": f"{XSD}integer", "value": "1"},
+        "y": {"type": "literal", "datatype": f"{XSD}integer", "value": "2"},
+        "a": {"type": "literal", "value": "a value"},
+        "p": {"type": "uri", "value": "https://example.org/p"},
+    }
+]
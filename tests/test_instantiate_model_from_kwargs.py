@@ -2,6 +2,8 @@
 
 import pytest
 
+from pydantic import BaseModel
+from pydantic.errors import PydanticUserError
 from rdfproxy import instantiate_model_from_kwargs
 from tests.data.init_model_from_kwargs_parameters import (
     init_model_from_kwargs_parameters,
@@ -14,3 +16,22 @@ def test_init_model_from_kwargs(model, kwargs):
     for _kwargs in kwargs:
         model_instance = instantiate_model_from_kwargs(model, **_kwargs)
         assert isinstance(model_instance, model)
+
+
+def test_init_model_from_kwargs_forward_reference():
+    """Check that models used before resolving forward references work after model_rebuild."""
+
+    class A(BaseModel):
+        p: str
+        b: "B"
+
+    with pytest.raises(PydanticUserError):
+        instantiate_model_from_kwargs(A, p="p", x=1)
+
+    class B(BaseModel):
+        x: int
+
+    A.model_rebuild()
+    model_instance = instantiate_model_from_kwargs(A, p="p", x=1)
+
+    assert model_instance == A(p="p", b=B(x=1))
@@ -0,0 +1,26 @@
+"""Pytest entry point for rdfproxy.utils.utils._load_query_result_json tests."""
+
+import pytest
+
+import rdfproxy.utils.utils
+from rdfproxy import get_bindings_from_query_result
+from tests.data.query_results import query_result_from_bindings, typed_bindings
+
+
+expected_bindings = [{"x": "1", "y": "2", "a": "a value", "p": "https://example.org/p"}]
+
+
+def test_load_query_result_json_orjson():
+    """Check that bindings are extracted if the response is parsed with orjson."""
+    pytest.importorskip("orjson")
+
+    query_result = query_result_from_bindings(typed_bindings)
+    assert list(get_bindings_from_query_result(query_result)) == expected_bindings
+
+
+def test_load_query_result_json_convert_fallback(monkeypatch):
+    """Check that bindings are extracted if orjson is not available."""
+    monkeypatch.setattr(rdfproxy.utils.utils, "orjson", None)
+
+    query_result = query_result_from_bindings(typed_bindings)
+    assert list(get_bindings_from_query_result(query_result)) == expected_bindings